@@ -12,19 +12,167 @@ import glob
 from datetime import datetime
 from pathlib import Path
 import logging
+import random
+import re
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import urljoin, urlparse
 from bs4 import BeautifulSoup
 
+try:
+    from pypdf import PdfReader  # Optional: text extraction for PDF near-duplicate detection
+except ImportError:
+    PdfReader = None
+
+try:
+    import numpy as np  # Optional: vectorised MinHash signatures
+except ImportError:
+    np = None
+
+class NearDuplicateIndex:
+    """MinHash signatures with an LSH band index for near-duplicate detection"""
+    
+    MERSENNE_PRIME = (1 << 61) - 1
+    MAX_HASH = (1 << 32) - 1
+    
+    # Chance that a pair exactly at the threshold shares at least one band
+    MIN_RECALL = 0.99
+    # Shingles hashed per numpy block, bounds memory to num_perm x 8192 x 8 bytes
+    CHUNK_SIZE = 8192
+    
+    def __init__(self, threshold=0.9, num_perm=128, shingle_size=5, seed=1):
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        
+        # 32-bit coefficients keep a * h + b below 2**64, so numpy and pure Python agree exactly
+        rng = random.Random(seed)
+        self.permutations = [
+            (rng.randint(1, self.MAX_HASH), rng.randint(0, self.MAX_HASH))
+            for _ in range(num_perm)
+        ]
+        if np is not None:
+            self._a = np.array([a for a, _ in self.permutations], dtype=np.uint64)[:, None]
+            self._b = np.array([b for _, b in self.permutations], dtype=np.uint64)[:, None]
+        
+        self.band_ranges = self._optimal_bands(threshold, num_perm)
+        
+        # One hash table per band: band key -> document keys sharing that band
+        self.buckets = [{} for _ in self.band_ranges]
+        self.signatures = {}
+    
+    @classmethod
+    def _optimal_bands(cls, threshold, num_perm, steps=100):
+        """Split all num_perm rows into bands for the given threshold
+        
+        Among splits that make a pair at exactly the threshold a candidate with
+        probability >= MIN_RECALL, pick the one with the smallest false-positive
+        area below the threshold. Extra candidates are cheap since query()
+        re-checks them against the full signature; missed ones are not.
+        Returns a list of (start, end) row ranges, one per band.
+        """
+        def candidate_probability(s, rows):
+            miss = 1.0
+            for r in rows:
+                miss *= 1 - s ** r
+            return 1 - miss
+        
+        # Thresholds too low to reach MIN_RECALL fall back to the highest-recall split
+        best_rows, best_fp = [1] * num_perm, float('inf')
+        for bands in range(1, num_perm + 1):
+            # Spread the remainder so every row lands in some band
+            size, extra = divmod(num_perm, bands)
+            rows = [size + 1] * extra + [size] * (bands - extra)
+            if candidate_probability(threshold, rows) < cls.MIN_RECALL:
+                continue
+            
+            step = threshold / steps
+            fp = sum(candidate_probability((i + 0.5) * step, rows) for i in range(steps)) * step
+            if fp < best_fp:
+                best_rows, best_fp = rows, fp
+        
+        ranges = []
+        start = 0
+        for r in best_rows:
+            ranges.append((start, start + r))
+            start += r
+        return ranges
+    
+    def signature(self, text):
+        """Compute the MinHash signature of a text's word shingles, or None if it has no words"""
+        words = re.findall(r"\w+", text.lower())
+        if not words:
+            return None
+        if len(words) < self.shingle_size:
+            shingles = {" ".join(words)}
+        else:
+            shingles = {
+                " ".join(words[i:i + self.shingle_size])
+                for i in range(len(words) - self.shingle_size + 1)
+            }
+        hashes = [zlib.crc32(shingle.encode('utf-8')) for shingle in shingles]
+        
+        if np is not None:
+            return self._signature_numpy(hashes)
+        
+        prime, max_hash = self.MERSENNE_PRIME, self.MAX_HASH
+        return tuple(
+            min(((a * h + b) % prime) & max_hash for h in hashes)
+            for a, b in self.permutations
+        )
+    
+    def _signature_numpy(self, hashes):
+        """Apply all permutations at once, in blocks of CHUNK_SIZE shingles"""
+        values = np.array(hashes, dtype=np.uint64)
+        prime, max_hash = np.uint64(self.MERSENNE_PRIME), np.uint64(self.MAX_HASH)
+        
+        signature = None
+        for start in range(0, len(values), self.CHUNK_SIZE):
+            block = values[None, start:start + self.CHUNK_SIZE]
+            block_min = (((self._a * block + self._b) % prime) & max_hash).min(axis=1)
+            signature = block_min if signature is None else np.minimum(signature, block_min)
+        return tuple(signature.tolist())
+    
+    def similarity(self, sig_a, sig_b):
+        """Estimate Jaccard similarity from two signatures"""
+        return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / self.num_perm
+    
+    def query(self, sig):
+        """Return (key, similarity) of the closest indexed document above threshold, or None"""
+        candidates = set()
+        for band, (start, end) in enumerate(self.band_ranges):
+            candidates.update(self.buckets[band].get(sig[start:end], ()))
+        
+        best = None
+        for key in candidates:
+            score = self.similarity(sig, self.signatures[key])
+            if score >= self.threshold and (best is None or score > best[1]):
+                best = (key, score)
+        return best
+    
+    def add(self, key, sig):
+        """Insert a signature into the band index"""
+        self.signatures[key] = sig
+        for band, (start, end) in enumerate(self.band_ranges):
+            self.buckets[band].setdefault(sig[start:end], []).append(key)
+
+def normalize_workspace_slugs(primary_slug, extra_slugs):
+    """Primary workspace first, followed by the other slugs without duplicates"""
+    return [primary_slug] + [
+        slug for slug in dict.fromkeys(extra_slugs) if slug and slug != primary_slug
+    ]
+
 class UniversalWebToLLMProcessor:
     def __init__(self, config):
         self.config = config
-        self.session = requests.Session()
-        self.session.headers.update({
-            "Authorization": f"Bearer {config['ANYTHINGLLM_API_KEY']}",
-            "User-Agent": config.get('USER_AGENT', 'Universal-Web-LLM-Processor/1.0')
-        })
+        self.session = self._create_session()
         self.base_url = config['ANYTHINGLLM_BASE_URL']
+        
+        # Fan-out: one scrape/download/upload, embedded into every listed workspace
         self.workspace_slug = config['WORKSPACE_SLUG']
+        self.workspace_slugs = normalize_workspace_slugs(
+            self.workspace_slug, config.get('WORKSPACE_SLUGS') or []
+        )
         
         # Create download directory (with parents)
         Path(config['DOWNLOAD_DIR']).mkdir(parents=True, exist_ok=True)
@@ -33,9 +181,18 @@ class UniversalWebToLLMProcessor:
         print(f"🌐 Universal Web-to-LLM Processor - {config['SOURCE_NAME']}")
         print("=" * 80)
         print(f"🎯 Target: {self.base_url}")
-        print(f"📂 Workspace: {self.workspace_slug}")
+        print(f"📂 Workspace{'s' if len(self.workspace_slugs) > 1 else ''}: {', '.join(self.workspace_slugs)}")
         print(f"🔗 Source: {config['SOURCE_URL']}")
     
+    def _create_session(self):
+        """Create an authenticated AnythingLLM session"""
+        session = requests.Session()
+        session.headers.update({
+            "Authorization": f"Bearer {self.config['ANYTHINGLLM_API_KEY']}",
+            "User-Agent": self.config.get('USER_AGENT', 'Universal-Web-LLM-Processor/1.0')
+        })
+        return session
+    
     def scrape_document_links(self, limit=None):
         """Generic document scraper with browser-like headers"""
         print(f"📥 Scraping {self.config['SOURCE_NAME']} for documents...")
@@ -125,6 +282,83 @@ class UniversalWebToLLMProcessor:
         
         return downloaded
     
+    def extract_text(self, file_path):
+        """Extract plain text from a downloaded document, or None if unsupported"""
+        suffix = Path(file_path).suffix.lower()
+        
+        try:
+            if suffix == '.pdf':
+                if PdfReader is None:
+                    return None
+                reader = PdfReader(str(file_path))
+                return "\n".join(page.extract_text() or "" for page in reader.pages)
+            if suffix in ('.html', '.htm'):
+                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                    return BeautifulSoup(f.read(), "html.parser").get_text(" ")
+            if suffix in ('.txt', '.md', '.csv'):
+                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                    return f.read()
+        except Exception as e:
+            print(f"   ⚠️ Could not extract text from {Path(file_path).name}: {e}")
+        
+        return None
+    
+    def filter_near_duplicates(self, file_paths):
+        """Flag or skip documents that are near-duplicates of an earlier document"""
+        threshold = self.config.get('DEDUP_THRESHOLD', 0.9)
+        try:
+            threshold = float(threshold)
+        except (TypeError, ValueError):
+            threshold = None
+        if threshold is None or not 0 < threshold <= 1:
+            print(f"   ⚠️ Invalid DEDUP_THRESHOLD {self.config.get('DEDUP_THRESHOLD')!r} - using 0.9")
+            threshold = 0.9
+        
+        action = str(self.config.get('DEDUP_ACTION', 'skip')).strip().lower()
+        if action not in ('skip', 'flag'):
+            # Unknown actions must never drop documents
+            print(f"   ⚠️ Unknown DEDUP_ACTION {self.config.get('DEDUP_ACTION')!r} - flagging only")
+            action = 'flag'
+        
+        print(f"\n🧬 Checking {len(file_paths)} documents for near-duplicates (threshold: {threshold}, action: {action})...")
+        
+        if PdfReader is None and any(Path(p).suffix.lower() == '.pdf' for p in file_paths):
+            print("   ⚠️ pypdf not installed - PDFs will not be checked (pip install pypdf)")
+        
+        index = NearDuplicateIndex(
+            threshold=threshold,
+            num_perm=self.config.get('DEDUP_NUM_PERM', 128)
+        )
+        
+        kept = []
+        duplicates = 0
+        for file_path in file_paths:
+            filename = Path(file_path).name
+            text = self.extract_text(file_path)
+            sig = index.signature(text) if text else None
+            if sig is None:
+                # No extractable words (unsupported type, scanned PDF, ...) - keep it
+                kept.append(file_path)
+                continue
+            
+            match = index.query(sig)
+            if match:
+                duplicates += 1
+                original, score = match
+                if action == 'flag':
+                    print(f"   🏷️ {filename} ~ {original} ({score:.0%} similar) - keeping")
+                    kept.append(file_path)
+                else:
+                    print(f"   ⏭️ {filename} ~ {original} ({score:.0%} similar) - skipping")
+                    continue
+            
+            index.add(filename, sig)
+            if not match:
+                kept.append(file_path)
+        
+        print(f"   🎯 Found {duplicates} near-duplicates, {len(kept)} documents remain")
+        return kept
+    
     def upload_to_anythingllm(self, file_paths):
         """Upload files to AnythingLLM"""
         print(f"\n📤 Uploading {len(file_paths)} files to AnythingLLM...")
@@ -154,9 +388,13 @@ class UniversalWebToLLMProcessor:
                     
                     result = response.json()
                     if result.get('success'):
-                        doc_info = result.get('document', {})
-                        uploaded_docs.append(doc_info.get('location', filename))
-                        print(f"   ✅ Upload successful!")
+                        doc_infos = result.get('documents') or [result.get('document', {})]
+                        locations = [doc.get('location') for doc in doc_infos if doc.get('location')]
+                        if locations:
+                            uploaded_docs.extend(locations)
+                            print(f"   ✅ Upload successful!")
+                        else:
+                            print(f"   ⚠️ Uploaded, but no document location returned - cannot embed")
                     else:
                         print(f"   ❌ Upload failed: {result}")
                         
@@ -165,63 +403,53 @@ class UniversalWebToLLMProcessor:
         
         return uploaded_docs
     
-    def embed_all_documents(self, batch_size=10):
-        """Move all documents to workspace for embedding in batches"""
-        print(f"\n🧠 Embedding all documents in workspace (batch size: {batch_size})...")
-        
-        # Get all documents from all folders
-        response = self.session.get(f"{self.base_url}/api/v1/documents")
-        response.raise_for_status()
-        data = response.json()
-        
-        all_docs = []
-        if 'localFiles' in data and 'items' in data['localFiles']:
-            for folder in data['localFiles']['items']:
-                folder_name = folder.get('name', 'unknown')
-                folder_docs = folder.get('items', [])
-                
-                if folder_docs:
-                    for doc in folder_docs:
-                        doc_identifier = f"{folder_name}/{doc['name']}"
-                        all_docs.append(doc_identifier)
-        
-        if not all_docs:
-            print("❌ No documents found")
+    def embed_documents(self, documents, batch_size=10, workspace_slug=None, session=None):
+        """Move uploaded documents to workspace for embedding in batches
+        
+        Returns True only if every document was embedded.
+        """
+        workspace_slug = workspace_slug or self.workspace_slug
+        session = session or self.session
+        tag = f"[{workspace_slug}] " if len(self.workspace_slugs) > 1 else ""
+        print(f"\n{tag}🧠 Embedding documents in workspace (batch size: {batch_size})...")
+        
+        if not documents:
+            print(f"{tag}❌ No documents to embed")
             return False
         
-        print(f"   📚 Found {len(all_docs)} total documents")
+        print(f"   {tag}📚 Embedding {len(documents)} documents")
         
         # Process in batches to avoid timeouts
-        total_batches = (len(all_docs) + batch_size - 1) // batch_size
+        total_batches = (len(documents) + batch_size - 1) // batch_size
         successfully_embedded = 0
         
         for batch_num in range(total_batches):
             start_idx = batch_num * batch_size
-            end_idx = min(start_idx + batch_size, len(all_docs))
-            batch_docs = all_docs[start_idx:end_idx]
+            end_idx = min(start_idx + batch_size, len(documents))
+            batch_docs = documents[start_idx:end_idx]
             
-            print(f"   📦 Processing batch {batch_num + 1}/{total_batches} ({len(batch_docs)} documents)...")
+            print(f"   {tag}📦 Processing batch {batch_num + 1}/{total_batches} ({len(batch_docs)} documents)...")
             
             payload = {"adds": batch_docs}
             
             try:
-                response = self.session.post(
-                    f"{self.base_url}/api/v1/workspace/{self.workspace_slug}/update-embeddings",
+                response = session.post(
+                    f"{self.base_url}/api/v1/workspace/{workspace_slug}/update-embeddings",
                     json=payload,
                     headers={"Content-Type": "application/json"},
                     timeout=120  # Increased timeout for batches
                 )
                 response.raise_for_status()
                 successfully_embedded += len(batch_docs)
-                print(f"   ✅ Batch {batch_num + 1} completed successfully!")
+                print(f"   {tag}✅ Batch {batch_num + 1} completed successfully!")
                 
                 # Add delay between batches to be respectful to the server
                 if batch_num < total_batches - 1:  # Don't delay after last batch
-                    print(f"   ⏳ Waiting 3 seconds before next batch...")
+                    print(f"   {tag}⏳ Waiting 3 seconds before next batch...")
                     time.sleep(3)
                 
             except requests.exceptions.Timeout:
-                print(f"   ⚠️ Batch {batch_num + 1} timed out - trying smaller batch...")
+                print(f"   {tag}⚠️ Batch {batch_num + 1} timed out - trying smaller batch...")
                 # Try with smaller batches (half size)
                 smaller_batch_size = max(1, len(batch_docs) // 2)
                 
@@ -231,41 +459,86 @@ class UniversalWebToLLMProcessor:
                     
                     try:
                         mini_payload = {"adds": mini_batch}
-                        response = self.session.post(
-                            f"{self.base_url}/api/v1/workspace/{self.workspace_slug}/update-embeddings",
+                        response = session.post(
+                            f"{self.base_url}/api/v1/workspace/{workspace_slug}/update-embeddings",
                             json=mini_payload,
                             headers={"Content-Type": "application/json"},
                             timeout=60
                         )
                         response.raise_for_status()
                         successfully_embedded += len(mini_batch)
-                        print(f"   ✅ Mini-batch with {len(mini_batch)} docs completed!")
+                        print(f"   {tag}✅ Mini-batch with {len(mini_batch)} docs completed!")
                         time.sleep(2)
                         
                     except Exception as e:
-                        print(f"   ❌ Mini-batch failed: {e}")
+                        print(f"   {tag}❌ Mini-batch failed: {e}")
                         
             except Exception as e:
-                print(f"   ❌ Batch {batch_num + 1} failed: {e}")
+                print(f"   {tag}❌ Batch {batch_num + 1} failed: {e}")
         
-        print(f"   🎯 Successfully embedded {successfully_embedded}/{len(all_docs)} documents")
+        print(f"   {tag}🎯 Successfully embedded {successfully_embedded}/{len(documents)} documents")
         
-        if successfully_embedded > 0:
-            print(f"   ✅ Embedding process completed!")
+        if successfully_embedded == len(documents):
+            print(f"   {tag}✅ Embedding process completed!")
             return True
+        elif successfully_embedded > 0:
+            print(f"   {tag}⚠️ {len(documents) - successfully_embedded} documents were not embedded")
+            return False
         else:
-            print(f"   ❌ No documents were successfully embedded")
+            print(f"   {tag}❌ No documents were successfully embedded")
             return False
     
-    def test_knowledge_base(self):
+    def _embed_workspace(self, workspace_slug, documents, batch_size):
+        """Embed documents into one workspace using a dedicated session"""
+        # requests.Session is not guaranteed thread-safe, so each worker opens its own
+        with self._create_session() as session:
+            return self.embed_documents(documents, batch_size, workspace_slug, session)
+    
+    def embed_into_workspaces(self, documents, batch_size=10):
+        """Embed this run's documents into every target workspace concurrently
+        
+        Returns a dict mapping each workspace slug to whether embedding succeeded.
+        """
+        if len(self.workspace_slugs) == 1:
+            return {self.workspace_slug: self.embed_documents(documents, batch_size)}
+        
+        try:
+            max_workers = int(self.config.get('EMBED_CONCURRENCY') or len(self.workspace_slugs))
+        except (TypeError, ValueError):
+            max_workers = len(self.workspace_slugs)
+        max_workers = max(1, min(max_workers, len(self.workspace_slugs)))
+        print(f"\n🔀 Fanning out {len(documents)} documents to {len(self.workspace_slugs)} workspaces ({max_workers} concurrent)...")
+        
+        results = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._embed_workspace, slug, documents, batch_size): slug
+                for slug in self.workspace_slugs
+            }
+            for future in as_completed(futures):
+                slug = futures[future]
+                try:
+                    results[slug] = future.result()
+                except Exception as e:
+                    print(f"   ❌ [{slug}] Embedding failed: {e}")
+                    results[slug] = False
+        
+        print(f"\n📊 Fan-out summary:")
+        for slug in self.workspace_slugs:
+            print(f"   {'✅' if results[slug] else '❌'} {slug}")
+        
+        return results
+    
+    def test_knowledge_base(self, workspace_slug=None):
         """Test the knowledge base with domain-specific questions"""
+        workspace_slug = workspace_slug or self.workspace_slug
         test_questions = self.config.get('TEST_QUESTIONS', [
             "What documents do you have access to?",
             "What are the main topics covered in these documents?",
             "Summarize the key information from your knowledge base."
         ])
         
-        print(f"\n🧪 Testing knowledge base...")
+        print(f"\n🧪 Testing knowledge base ({workspace_slug})...")
         
         for question in test_questions[:2]:  # Test first 2 questions
             print(f"   ❓ Question: {question}")
@@ -274,7 +547,7 @@ class UniversalWebToLLMProcessor:
             
             try:
                 response = self.session.post(
-                    f"{self.base_url}/api/v1/workspace/{self.workspace_slug}/chat",
+                    f"{self.base_url}/api/v1/workspace/{workspace_slug}/chat",
                     json=payload,
                     headers={"Content-Type": "application/json"},
                     timeout=30
@@ -310,23 +583,38 @@ class UniversalWebToLLMProcessor:
         if not downloaded:
             return False
         
+        # Optional: drop near-duplicate revisions before they are embedded
+        if self.config.get('DEDUP_ENABLED'):
+            downloaded = self.filter_near_duplicates(downloaded)
+            if not downloaded:
+                return False
+        
         # Step 3: Upload to AnythingLLM
         uploaded = self.upload_to_anythingllm(downloaded)
         if not uploaded:
             return False
         
-        # Step 4: Embed in workspace
-        if not self.embed_all_documents():
+        # Step 4: Embed this run's uploads in workspace(s); a workspace only
+        # counts as embedded once every uploaded document made it in
+        results = self.embed_into_workspaces(uploaded)
+        embedded = [slug for slug in self.workspace_slugs if results.get(slug)]
+        failed = [slug for slug in self.workspace_slugs if not results.get(slug)]
+        if not embedded:
             return False
         
         # Step 5: Test knowledge base
-        self.test_knowledge_base()
+        for workspace_slug in embedded:
+            self.test_knowledge_base(workspace_slug)
         
         print("\n" + "=" * 80)
-        print("🎉 SUCCESS! Knowledge base ready for queries")
-        print(f"🌐 Access: {self.base_url}/workspace/{self.workspace_slug}")
+        if failed:
+            print(f"⚠️ PARTIAL: embedding failed for {', '.join(failed)}")
+        else:
+            print("🎉 SUCCESS! Knowledge base ready for queries")
+        for workspace_slug in embedded:
+            print(f"🌐 Access: {self.base_url}/workspace/{workspace_slug}")
         
-        return True
+        return not failed
 
 def get_user_configuration():
     """Interactive configuration setup"""
@@ -355,6 +643,9 @@ def get_user_configuration():
     workspace_input = input(f"📋 Enter workspace name (default: {default_slug}): ").strip()
     config['WORKSPACE_SLUG'] = workspace_input if workspace_input else default_slug
     config['FOLDER_NAME'] = config['WORKSPACE_SLUG']
+    extra_input = input("🔀 Additional workspaces to embed the same documents into (comma-separated, optional): ").strip()
+    extra_slugs = [slug.strip() for slug in extra_input.split(',') if slug.strip()]
+    config['WORKSPACE_SLUGS'] = normalize_workspace_slugs(config['WORKSPACE_SLUG'], extra_slugs)
     
     # File configuration
     print("\n📄 FILE CONFIGURATION")
@@ -378,6 +669,18 @@ def get_user_configuration():
         limit = 20
     config['LIMIT'] = limit
     
+    dedup_input = input("🧬 Skip near-duplicate documents before embedding? (y/N): ").strip().lower()
+    config['DEDUP_ENABLED'] = dedup_input in ['y', 'yes']
+    if config['DEDUP_ENABLED']:
+        threshold_input = input("📏 Similarity threshold (0-1, default: 0.9): ").strip()
+        try:
+            threshold = float(threshold_input) if threshold_input else 0.9
+        except ValueError:
+            threshold = 0.9
+        config['DEDUP_THRESHOLD'] = threshold if 0 < threshold <= 1 else 0.9
+        action_input = input("🏷️ Action for near-duplicates - skip or flag (default: skip): ").strip().lower()
+        config['DEDUP_ACTION'] = 'flag' if action_input == 'flag' else 'skip'
+    
     # Download directory
     safe_name = config['SOURCE_NAME'].lower().replace(' ', '_').replace('-', '_')
     config['DOWNLOAD_DIR'] = f"./downloads/{safe_name}"
@@ -412,8 +715,12 @@ def get_user_configuration():
     print(f"🌐 Source URL: {config['SOURCE_URL']}")
     print(f"🤖 AnythingLLM Server: {config['ANYTHINGLLM_BASE_URL']}")
     print(f"📂 Workspace: {config['WORKSPACE_SLUG']}")
+    if len(config['WORKSPACE_SLUGS']) > 1:
+        print(f"🔀 Fan-out Workspaces: {', '.join(config['WORKSPACE_SLUGS'][1:])}")
     print(f"📎 File Types: {', '.join(config['FILE_EXTENSIONS'])}")
     print(f"🔢 Document Limit: {config['LIMIT'] if config['LIMIT'] else 'No limit'}")
+    if config['DEDUP_ENABLED']:
+        print(f"🧬 Near-Duplicates: {config['DEDUP_ACTION']} above {config['DEDUP_THRESHOLD']} similarity")
     print(f"📁 Download Directory: {config['DOWNLOAD_DIR']}")
     print(f"🧪 Test Questions: {len(config['TEST_QUESTIONS'])} configured")
     